@@ -11,6 +11,52 @@ import io
 import numpy as np
 
 
+try:
+    # Optional: with numba installed the conversion compiles to a single
+    # fused SIMD loop, skipping NumPy's ufunc dispatch overhead on the
+    # small buffers typical of push-to-talk utterances
+    from numba import njit
+
+    @njit(cache=True, fastmath=True)
+    def _pcm16_to_f32(pcm, out):
+        for i in range(pcm.shape[0]):
+            out[i] = pcm[i] * np.float32(1.0 / 32768.0)
+except ImportError:
+    def _pcm16_to_f32(pcm, out):
+        np.multiply(pcm, np.float32(1.0 / 32768.0), out=out, casting='unsafe')
+
+
+# Pool of float32 buffers recycled between utterances, keyed on the
+# rounded-up buffer length. Avoids allocating a fresh array per stop()
+# call in the push-to-talk loop.
+_FLOAT_POOL: dict[int, list[np.ndarray]] = {}
+_FLOAT_POOL_LOCK = threading.Lock()
+_FLOAT_POOL_MAX_PER_SIZE = 4
+
+
+def _acquire_float_buffer(num_samples: int) -> np.ndarray:
+    """Get a float32 buffer of at least num_samples from the pool"""
+    # Round up to a page-sized multiple so buffers of similar length
+    # share a pool slot
+    capacity = (num_samples + 4095) & ~4095
+    with _FLOAT_POOL_LOCK:
+        pool = _FLOAT_POOL.get(capacity)
+        if pool:
+            return pool.pop()
+    return np.empty(capacity, dtype=np.float32)
+
+
+def _release_float_buffer(buf: np.ndarray):
+    """Return a float32 buffer (or a view into one) to the pool"""
+    base = buf.base if buf.base is not None else buf
+    if not isinstance(base, np.ndarray) or base.dtype != np.float32:
+        return
+    with _FLOAT_POOL_LOCK:
+        pool = _FLOAT_POOL.setdefault(len(base), [])
+        if len(pool) < _FLOAT_POOL_MAX_PER_SIZE:
+            pool.append(base)
+
+
 class AudioRecorder:
     """Audio recorder that captures microphone input"""
     
@@ -23,62 +69,86 @@ class AudioRecorder:
         self.audio = pyaudio.PyAudio()
         self.stream = None
         self.recording = False
-        self.frames = []
-        self.thread = None
-        
-    def _record_thread(self):
-        """Thread function that captures audio data"""
-        while self.recording:
-            data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-            self.frames.append(data)
-    
+        self._buf = bytearray()
+
+    def _capture_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback that appends captured chunks to the buffer"""
+        self._buf.extend(in_data)
+        return (None, pyaudio.paContinue)
+
     def start(self):
         """Start recording audio"""
         if self.recording:
             return
-            
-        self.frames = []
+
+        self._buf = bytearray()
         self.recording = True
-        
-        # Open audio stream
+
+        # Open audio stream in callback mode - PortAudio delivers chunks
+        # from its own thread, so no Python-level polling loop is needed
         self.stream = self.audio.open(
             format=self.format,
             channels=self.channels,
             rate=self.sample_rate,
             input=True,
-            frames_per_buffer=self.chunk_size
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._capture_callback
         )
-        
-        # Start recording thread
-        self.thread = threading.Thread(target=self._record_thread)
-        self.thread.start()
-    
+
     def stop(self):
         """Stop recording and return audio data"""
         if not self.recording:
             return None
-            
+
         self.recording = False
-        
-        # Wait for recording thread to finish
-        if self.thread and self.thread.is_alive():
-            self.thread.join()
-        
+
         # Close audio stream
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
             self.stream = None
         
-        # Convert frames to audio data format expected by faster-whisper
-        if self.frames:
-            audio_data = b''.join(self.frames)
-            # Convert to numpy array of float32 values normalized to [-1, 1]
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return audio_np
-        
+        # Convert captured audio to the format expected by faster-whisper.
+        # We capture at 16 kHz mono int16, which is already Whisper's
+        # native rate, so this conversion is the only per-utterance pass
+        # over the samples: faster-whisper's feature extractor requires
+        # float32 in [-1, 1] and does not accept raw int16 through
+        # WhisperModel.transcribe, so it cannot be skipped entirely.
+        if self._buf:
+            # Convert to float32 values normalized to [-1, 1] in a single
+            # vectorized pass into a preallocated buffer (no intermediate
+            # arrays from astype + divide), reading straight out of the
+            # capture buffer without an extra join/copy
+            num_samples = len(self._buf) // 2
+            audio_np = _acquire_float_buffer(num_samples)
+            _pcm16_to_f32(
+                np.frombuffer(self._buf, dtype=np.int16, count=num_samples),
+                audio_np[:num_samples]
+            )
+            return audio_np[:num_samples]
+
         return None
-    
+
+    def snapshot(self):
+        """Return the audio captured so far without stopping the recording"""
+        num_samples = len(self._buf) // 2
+        if num_samples == 0:
+            return None
+
+        # Slicing the bytearray copies atomically under the GIL, so the
+        # capture callback can keep extending it while we convert
+        pcm_bytes = self._buf[:num_samples * 2]
+        audio_np = _acquire_float_buffer(num_samples)
+        _pcm16_to_f32(
+            np.frombuffer(pcm_bytes, dtype=np.int16, count=num_samples),
+            audio_np[:num_samples]
+        )
+        return audio_np[:num_samples]
+
+    def release(self, buf: np.ndarray):
+        """Return a buffer obtained from stop() to the pool for reuse"""
+        _release_float_buffer(buf)
+
     def __del__(self):
         """Cleanup resources"""
         if self.recording:
@@ -1,25 +1,45 @@
-from .terminal import Terminal
+from .terminal import Terminal, _CLEAR_SCREEN_RE
 from enum import Enum
-import time
 
 class ClaudeState(Enum):
     TEXT_INPUT = "text_input"
     CHOICE_INPUT = "choice_input"
 
+# UTF-8 encoding of the "❯" choice prompt marker
+_PROMPT_MARKER = "❯".encode('utf-8')
+
 class Claude:
     def __init__(self):
         self.terminal = Terminal("/bin/bash", ["/bin/bash", "-c", "claude", "--print"], enable_keyboard=False)
         self.terminal.add_change_callback(self.on_output_change)
         self.log_file = open("claude.log", "w")
         self.state = ClaudeState.TEXT_INPUT
+        self._carry = b''
+        self._has_prompt = False
 
     def log(self, message: str):
         self.log_file.write(message + "\n")
         self.log_file.flush()
 
-    def on_output_change(self, _diff: str):
-        output = self.terminal.get_output_buffer_text()
-        if "❯" in output:
+    def on_output_change(self, diff: bytes):
+        # Scan only the raw bytes of this chunk for the marker's UTF-8
+        # encoding - no decode and no whole-buffer copy on this path.
+        # A clear sequence wipes the screen, so the prompt flag resets
+        # and only output after the last clear in the chunk counts.
+        last_clear = None
+        for last_clear in _CLEAR_SCREEN_RE.finditer(diff):
+            pass
+        if last_clear is not None:
+            self._has_prompt = False
+            data = diff[last_clear.end():]
+        else:
+            # Prepend the tail of the previous chunk in case the marker
+            # straddled two reads
+            data = self._carry + diff
+        if _PROMPT_MARKER in data:
+            self._has_prompt = True
+        self._carry = data[-(len(_PROMPT_MARKER) - 1):]
+        if self._has_prompt:
             if self.state != ClaudeState.CHOICE_INPUT:
                 self.log(f"State changed to CHOICE_INPUT")
             self.state = ClaudeState.CHOICE_INPUT
@@ -44,7 +64,9 @@ class Claude:
 
     def _send_instruction(self, instruction: str):
         self.terminal.send_input(instruction)
-        time.sleep(0.1)
+        # Wait for the PTY to flush the instruction before sending enter,
+        # instead of sleeping a fixed 100 ms
+        self.terminal.drain()
         self.terminal.send_key("enter")
 
     def start(self):
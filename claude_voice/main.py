@@ -4,23 +4,27 @@
 Main module for Claude Voice TUI wrapper
 """
 
-from .listener import AudioListener, Model
+from .listener import AudioListener, default_model
 from .claude import Claude
 from .pushtotalk import PushToTalk
 from pynput import keyboard
 
 def main():
     print("Starting up...")
-    audio_listener = AudioListener(model=Model.LARGE)
+    # Kick off the Whisper model load in the background and set up the
+    # rest of the pipeline while it runs, so both finish together
+    audio_listener = AudioListener(model=default_model())
     audio_listener.start()
 
     ptt = PushToTalk(audio_listener, hotkey=keyboard.Key.ctrl_l)
-    print("Hello from Claude Voice!")
 
     claude = Claude()
 
     audio_listener.add_transcription_callback(claude.process_instruction)
 
+    audio_listener.wait_until_ready()
+    print("Hello from Claude Voice!")
+
     try:
         ptt.start()
         claude.start()
@@ -6,54 +6,63 @@ Terminal API module for running programs with PTY and capturing output
 
 import pty
 import os
+import re
+import signal
 import sys
 import threading
 import select
+import selectors
+import time
 import tty
 import termios
 from typing import List, Callable, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 
+# Clear screen sequences (ESC[2J, ESC[H or ESCc), compiled once so the
+# per-chunk check is a single scan in C instead of three substring searches
+_CLEAR_SCREEN_RE = re.compile(rb'\x1b(?:\[2J|\[H|c)')
+
+
 KEY_MAPPINGS = {
-    'enter': '\r',
-    'newline': '\n',
-    'tab': '\t',
-    'esc': '\x1b',
+    'enter': b'\r',
+    'newline': b'\n',
+    'tab': b'\t',
+    'esc': b'\x1b',
     # Arrow keys (VT100 codes)
-    'up': '\x1b[A',
-    'down': '\x1b[B',
-    'right': '\x1b[C',
-    'left': '\x1b[D',
+    'up': b'\x1b[A',
+    'down': b'\x1b[B',
+    'right': b'\x1b[C',
+    'left': b'\x1b[D',
     # Home/End
-    'home': '\x1b[H',
-    'end': '\x1b[F',
+    'home': b'\x1b[H',
+    'end': b'\x1b[F',
     # Page up/down
-    'pageup': '\x1b[5~',
-    'pagedown': '\x1b[6~',
+    'pageup': b'\x1b[5~',
+    'pagedown': b'\x1b[6~',
     # Insert/Delete
-    'insert': '\x1b[2~',
-    'delete': '\x1b[3~',
+    'insert': b'\x1b[2~',
+    'delete': b'\x1b[3~',
     # Function keys
-    'f1': '\x1bOP',
-    'f2': '\x1bOQ',
-    'f3': '\x1bOR',
-    'f4': '\x1bOS',
-    'f5': '\x1b[15~',
-    'f6': '\x1b[17~',
-    'f7': '\x1b[18~',
-    'f8': '\x1b[19~',
-    'f9': '\x1b[20~',
-    'f10': '\x1b[21~',
-    'f11': '\x1b[23~',
-    'f12': '\x1b[24~',
+    'f1': b'\x1bOP',
+    'f2': b'\x1bOQ',
+    'f3': b'\x1bOR',
+    'f4': b'\x1bOS',
+    'f5': b'\x1b[15~',
+    'f6': b'\x1b[17~',
+    'f7': b'\x1b[18~',
+    'f8': b'\x1b[19~',
+    'f9': b'\x1b[20~',
+    'f10': b'\x1b[21~',
+    'f11': b'\x1b[23~',
+    'f12': b'\x1b[24~',
     # Control characters
-    'ctrl-c': '\x03',
-    'ctrl-d': '\x04',
-    'ctrl-z': '\x1a',
+    'ctrl-c': b'\x03',
+    'ctrl-d': b'\x04',
+    'ctrl-z': b'\x1a',
     # Shift combinations (may not be widely supported)
-    'shift-tab': '\x1b[Z',
-    'shift-enter': '\x1b[13;2u', # xterm modifyOtherKeys
+    'shift-tab': b'\x1b[Z',
+    'shift-enter': b'\x1b[13;2u', # xterm modifyOtherKeys
 }
 
 
@@ -70,7 +79,9 @@ class Terminal:
         """
         self.program = program
         self.args = args or [program]
-        self.output_buffer = []
+        self.output_buffer = bytearray()
+        self._text_cache = None
+        self._buffer_version = 0
         self.buffer_lock = threading.Lock()
         self.change_callbacks = []
         self.master_fd = None
@@ -80,46 +91,60 @@ class Terminal:
         self.input_thread = None
         self.enable_keyboard = enable_keyboard
 
-    def add_change_callback(self, callback: Callable[[str], None]):
+    def add_change_callback(self, callback: Callable[[bytes], None]):
         """
         Add a callback function that gets called when output_buffer changes
 
         Args:
-            callback: Function that takes the new output string as parameter
+            callback: Function that takes the newly read raw bytes as parameter
         """
         self.change_callbacks.append(callback)
 
-    def remove_change_callback(self, callback: Callable[[str], None]):
+    def remove_change_callback(self, callback: Callable[[bytes], None]):
         """Remove a previously added callback"""
         if callback in self.change_callbacks:
             self.change_callbacks.remove(callback)
 
-    def get_output_buffer(self) -> List[str]:
+    def get_output_buffer(self) -> bytes:
         """
         Get a copy of the current output buffer
 
         Returns:
-            List of output strings
+            Raw output bytes
         """
         with self.buffer_lock:
-            return self.output_buffer.copy()
+            return bytes(self.output_buffer)
 
     def get_output_buffer_text(self) -> str:
         """
         Get the output buffer as a single string
 
         Returns:
-            Concatenated output buffer content
+            Decoded output buffer content
         """
         with self.buffer_lock:
-            return ''.join(self.output_buffer)
+            if self._text_cache is not None:
+                return self._text_cache
+            raw = bytes(self.output_buffer)
+            version = self._buffer_version
+
+        # Decode outside the lock so a long decode never blocks the PTY
+        # reader thread from appending
+        text = raw.decode('utf-8', errors='ignore')
+
+        with self.buffer_lock:
+            if self._buffer_version == version:
+                self._text_cache = text
+        return text
 
     def clear_output_buffer(self):
         """Clear the output buffer"""
         with self.buffer_lock:
             self.output_buffer.clear()
+            self._text_cache = None
+            self._buffer_version += 1
 
-    def _notify_change(self, new_output: str):
+    def _notify_change(self, new_output: bytes):
         """Notify all registered callbacks about buffer changes"""
         for callback in self.change_callbacks:
             try:
@@ -129,31 +154,66 @@ class Terminal:
 
     def _handle_output(self):
         """Handle output from the program process"""
-        while self.running:
-            try:
-                ready, _, _ = select.select([self.master_fd], [], [], 0.1)
-
-                if self.master_fd in ready:
-                    data = os.read(self.master_fd, 1024)
-                    if data:
-                        decoded_data = data.decode('utf-8', errors='ignore')
-
-                        # Check for clear screen sequence (ESC[2J or ESC[H)
-                        if '\x1b[2J' in decoded_data or '\x1b[H' in decoded_data or '\x1bc' in decoded_data:
-                            with self.buffer_lock:
-                                self.output_buffer.clear()
-
-                        with self.buffer_lock:
-                            self.output_buffer.append(decoded_data)
-
-                        # Notify callbacks about the change
-                        self._notify_change(decoded_data)
-
-                        # Also write to stdout immediately
-                        sys.stdout.write(decoded_data)
-                        sys.stdout.flush()
-            except OSError:
-                break
+        # Use a selector (epoll on Linux) with a non-blocking fd so each
+        # wakeup drains everything available in large reads, instead of
+        # paying a select + read syscall per kilobyte of output
+        os.set_blocking(self.master_fd, False)
+        selector = selectors.DefaultSelector()
+        selector.register(self.master_fd, selectors.EVENT_READ)
+        try:
+            while self.running:
+                if not selector.select(0.1):
+                    continue
+
+                # Coalesce everything read in this drain into one chunk so
+                # callbacks and stdout are hit once per burst instead of
+                # once per read
+                batch = []
+                eof = False
+                while True:
+                    try:
+                        data = os.read(self.master_fd, 65536)
+                    except BlockingIOError:
+                        break
+                    except OSError:
+                        # On Linux the master raises EIO once the child
+                        # closes the slave side; treat it as EOF so the
+                        # data already collected still gets processed
+                        eof = True
+                        break
+
+                    if not data:
+                        eof = True
+                        break
+
+                    batch.append(data)
+
+                if batch:
+                    raw_data = b''.join(batch)
+
+                    clear = bool(_CLEAR_SCREEN_RE.search(raw_data))
+
+                    with self.buffer_lock:
+                        if clear:
+                            self.output_buffer.clear()
+                        self.output_buffer += raw_data
+                        self._text_cache = None
+                        self._buffer_version += 1
+
+                    # Notify callbacks with the raw bytes - they only need
+                    # to scan for markers, so no decode on this path
+                    self._notify_change(raw_data)
+
+                    # Also write to stdout immediately
+                    sys.stdout.write(raw_data.decode('utf-8', errors='ignore'))
+                    sys.stdout.flush()
+
+                if eof:
+                    return
+        except OSError:
+            pass
+        finally:
+            selector.close()
 
     def _handle_input(self):
         """Handle input to the program process"""
@@ -239,16 +299,30 @@ class Terminal:
         if not self.running:
             return
 
+        # Flip the flag before touching the fd so the reader thread's next
+        # wakeup exits cleanly instead of racing a closed descriptor
         self.running = False
 
         if self.master_fd:
-            os.close(self.master_fd)
+            try:
+                os.close(self.master_fd)
+            except OSError:
+                pass
             self.master_fd = None
 
         if self.pid:
             try:
-                os.kill(self.pid, 9)  # Force kill
-                os.waitpid(self.pid, 0)
+                # Ask the child to exit first so it can clean up, then
+                # escalate to SIGKILL if it hasn't gone away shortly
+                os.kill(self.pid, signal.SIGTERM)
+                for _ in range(20):
+                    pid, _status = os.waitpid(self.pid, os.WNOHANG)
+                    if pid:
+                        break
+                    time.sleep(0.01)
+                else:
+                    os.kill(self.pid, signal.SIGKILL)
+                    os.waitpid(self.pid, 0)
             except (OSError, ProcessLookupError):
                 pass
             self.pid = None
@@ -269,6 +343,21 @@ class Terminal:
         except OSError as e:
             raise RuntimeError(f"Error sending input: {e}")
 
+    def drain(self):
+        """
+        Wait until all input written to the terminal has been transmitted.
+
+        Raises:
+            RuntimeError: If the terminal is not running.
+        """
+        if not self.running or not self.master_fd:
+            raise RuntimeError("Terminal is not running")
+
+        try:
+            termios.tcdrain(self.master_fd)
+        except OSError as e:
+            raise RuntimeError(f"Error draining terminal: {e}")
+
     def send_key(self, key: str):
         """
         Send a special key to the terminal process.
@@ -288,9 +377,8 @@ class Terminal:
         if key_lower not in KEY_MAPPINGS:
             raise ValueError(f"Unknown key: '{key}'. Supported keys are: {', '.join(KEY_MAPPINGS.keys())}")
 
-        data_to_send = KEY_MAPPINGS[key_lower]
         try:
-            os.write(self.master_fd, data_to_send.encode('utf-8'))
+            os.write(self.master_fd, KEY_MAPPINGS[key_lower])
         except OSError as e:
             raise RuntimeError(f"Error sending key '{key}': {e}")
 